@@ -17,21 +17,33 @@ except ImportError:
     from multiprocessing import cpu_count
 
 
+def usable_cpus():
+    """Return the number of CPUs this process may run on."""
+    try:
+        # Honours CPU affinity and cgroup cpusets, unlike cpu_count().
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return cpu_count() or 1
+
+
+# Where a build leaves the executable relative to the checkout, by platform.
+# configure adds a '.exe' suffix when the checkout is on a case-insensitive
+# file system (e.g. OS X, a FAT-formatted USB drive, or WSL's /mnt/c).
+UNIX_EXECUTABLES = [('python',), ('python.exe',)]
+EXECUTABLES = {
+    'cygwin': [('python.exe',)],
+    # 32-bit and then 64-bit Windows
+    'win32': [('PCBuild', 'python_d.exe'),
+              ('PCBuild', 'AMD64', 'python_d.exe')],
+}
+
+
 def executable(directory):
-    cmd = os.path.join(directory, 'python')
-    # UNIX
-    if not os.path.isfile(cmd):
-        # OS X
-        cmd += '.exe'
-        if not os.path.isfile(cmd):
-            # 32-bit Windows
-            cmd = os.path.join(directory, 'PCBuild', 'python_d.exe')
-            if not os.path.isfile(cmd):
-                # 64-bit Windows
-                cmd = os.path.join(directory, 'PCBuild', 'AMD64', 'python_d.exe')
-                if not os.path.isfile(cmd):
-                    return None
-    return os.path.abspath(cmd)
+    for parts in EXECUTABLES.get(sys.platform, UNIX_EXECUTABLES):
+        cmd = os.path.join(directory, *parts)
+        if os.path.isfile(cmd):
+            return os.path.abspath(cmd)
+    return None
 
 
 def main(directory):
@@ -39,18 +51,14 @@ def main(directory):
         print("See the devguide's Getting Set Up guide for building under "
               "Windows")
 
-    cwd = os.getcwd()
-    os.chdir(directory)
-    try:
-        if os.path.isfile('Makefile'):
-            print('Makefile already exists; skipping ./configure')
-        else:
-            subprocess.check_call(['./configure', '--prefix=/tmp/cpython',
-                                   '--with-pydebug'])
-        make_cmd = ['make', '-s', '-j', str(cpu_count())]
-        subprocess.call(make_cmd)
-    finally:
-        os.chdir(cwd)
+    if os.path.isfile(os.path.join(directory, 'Makefile')):
+        print('Makefile already exists; skipping ./configure')
+    else:
+        subprocess.check_call(['./configure', '--quiet',
+                               '--prefix=/tmp/cpython', '--with-pydebug'],
+                              cwd=directory)
+    make_cmd = ['make', '-s', '-j', str(usable_cpus())]
+    subprocess.check_call(make_cmd, cwd=directory)
     return executable(directory)
 
 if __name__ == '__main__':
@@ -64,7 +72,14 @@ if __name__ == '__main__':
         directory = 'cpython'
     else:
         directory = '.'
-    executable = main(directory)
+    try:
+        executable = main(directory)
+    except subprocess.CalledProcessError as exc:
+        print('{} failed'.format(' '.join(exc.cmd)), file=sys.stderr)
+        # A negative return code means the command was killed by a signal;
+        # report it the way a shell would.
+        returncode = exc.returncode
+        sys.exit(returncode if returncode > 0 else 128 - returncode)
     if not executable:
         print('CPython executable NOT found')
     else: